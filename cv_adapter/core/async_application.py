@@ -68,6 +68,8 @@ class AsyncCVAdapterApplication:
         """
         self.ai_model = ai_model
         self._initialized = False
+        # Shared by the summary generator and minimal CV rendering
+        self._minimal_renderer = MinimalMarkdownRenderer()
         self.competence_generator: Optional[
             AsyncGenerator[CoreCompetenceGenerationContext, List[CoreCompetenceDTO]]
         ] = None
@@ -103,7 +105,7 @@ class AsyncCVAdapterApplication:
         )
         self.skills_generator = await create_skills_generator(ai_model=self.ai_model)
         self.summary_generator = await create_summary_generator(
-            MinimalMarkdownRenderer(), ai_model=self.ai_model
+            self._minimal_renderer, ai_model=self.ai_model
         )
         self.title_generator = await create_title_generator(ai_model=self.ai_model)
 
@@ -224,7 +226,7 @@ class AsyncCVAdapterApplication:
         )
 
         # Create minimal CV for summary generation
-        minimal_cv_dto = MinimalMarkdownRenderer().render_to_string(
+        minimal_cv_dto = self._minimal_renderer.render_to_string(
             MinimalCVDTO(
                 title=title_dto,
                 core_competences=core_competences,
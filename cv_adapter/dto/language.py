@@ -42,6 +42,18 @@ class Language(BaseModel):
             raise KeyError(f"Language with code {code} not found")
         return language
 
+    def __eq__(self, other: object) -> bool:
+        """Compare languages by code, short-circuiting on identity."""
+        if self is other:
+            return True
+        if isinstance(other, Language):
+            return self.code == other.code
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Hash the language by its code, consistent with equality."""
+        return hash(self.code)
+
     def __str__(self) -> str:
         """Return the language code."""
         return self.code.value
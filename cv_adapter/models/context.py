@@ -30,6 +30,11 @@ def language_context(language: "Language") -> Iterator[None]:
             cv = generate_cv(...)
         ```
     """
+    if current_language.get() is language:
+        # Already active: skip the redundant set/reset round-trip
+        yield
+        return
+
     token = current_language.set(language)
     try:
         yield
@@ -75,7 +75,8 @@ class JSONRenderer(BaseRenderer[CVDTO]):
             RendererError: If loading or validation fails
         """
         try:
-            return self.load_from_string(file_path.read_text(encoding="utf-8"))
+            # Pydantic parses the raw bytes directly, without a decoded copy
+            return CVDTO.model_validate_json(file_path.read_bytes())
         except Exception as e:
             raise RendererError(f"Error loading CV from JSON file: {e}")
 
@@ -13,7 +13,11 @@ from cv_adapter.services.generators.protocols import (
     AsyncGenerator,
     CoreCompetenceGenerationContext,
 )
-from cv_adapter.services.generators.utils import load_system_prompt, prepare_context
+from cv_adapter.services.generators.utils import (
+    load_system_prompt,
+    prepare_context,
+    validate_generation_context,
+)
 
 
 async def create_core_competence_generator(
@@ -62,10 +66,7 @@ async def create_core_competence_generator(
             List of generated core competences
         """
         # Validate input parameters
-        if not context.cv or not context.cv.strip():
-            raise ValueError("CV text is required")
-        if not context.job_description.strip():
-            raise ValueError("Job description is required")
+        validate_generation_context(context)
 
         # Prepare context string
         context_str = prepare_context(context_template_path, context)
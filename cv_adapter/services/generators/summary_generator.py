@@ -14,7 +14,11 @@ from cv_adapter.services.generators.protocols import (
     AsyncGenerator,
     ComponentGenerationContext,
 )
-from cv_adapter.services.generators.utils import load_system_prompt, prepare_context
+from cv_adapter.services.generators.utils import (
+    load_system_prompt,
+    prepare_context,
+    validate_component_context,
+)
 
 
 async def create_summary_generator(
@@ -66,12 +70,7 @@ async def create_summary_generator(
             Generated summary
         """
         # Validate input parameters
-        if not context.cv or not context.cv.strip():
-            raise ValueError("CV text is required")
-        if not context.job_description or not context.job_description.strip():
-            raise ValueError("Job description is required")
-        if not context.core_competences or not context.core_competences.strip():
-            raise ValueError("Core competences are required")
+        validate_component_context(context)
 
         # Prepare context string
         context_str = prepare_context(
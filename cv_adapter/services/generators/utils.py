@@ -1,56 +1,131 @@
 """Shared utility functions for generators."""
 
 import os
+from functools import lru_cache
 from typing import Any, Dict
 
 from jinja2 import Environment, FileSystemLoader, StrictUndefined
 
 from cv_adapter.dto.language import ENGLISH, LanguageConfig
 from cv_adapter.models.context import get_current_language
-from cv_adapter.services.generators.protocols import BaseGenerationContext
+from cv_adapter.services.generators.protocols import (
+    BaseGenerationContext,
+    ComponentGenerationContext,
+)
 
 
-def load_system_prompt(template_path: str) -> str:
+@lru_cache(maxsize=None)
+def get_template_environment(template_dir: str) -> Environment:
     """
-    Load system prompt from a Jinja2 template.
+    Get a cached Jinja2 environment for a template directory.
+
+    Jinja2 keeps compiled templates in the environment and reloads them when the
+    source file changes, so sharing one environment per directory avoids
+    re-reading and re-parsing templates on every generator call.
+
+    Args:
+        template_dir: Directory containing the templates
+
+    Returns:
+        Jinja2 environment bound to the directory
+    """
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        undefined=StrictUndefined,  # Raise errors for undefined variables
+    )
+
+
+@lru_cache(maxsize=128)
+def _render_system_prompt(template_path: str, mtime_ns: int, size: int) -> str:
+    """
+    Render a system prompt template, memoized per file version.
+
+    The modification time and size only take part in the cache key, so an
+    edited template is rendered again instead of served from the cache.
 
     Args:
         template_path: Path to the system prompt template
+        mtime_ns: Modification time of the template file in nanoseconds
+        size: Size of the template file in bytes
 
     Returns:
         Rendered system prompt
     """
-    # Validate template path
-    if not os.path.exists(template_path):
-        raise FileNotFoundError(f"System prompt template not found: {template_path}")
+    # Get the directory and filename separately
+    template_dir = os.path.dirname(template_path)
+    template_filename = os.path.basename(template_path)
 
-    try:
-        # Get the directory and filename separately
-        template_dir = os.path.dirname(template_path)
-        template_filename = os.path.basename(template_path)
-
-        # Create Jinja2 environment
-        env = Environment(
-            loader=FileSystemLoader(template_dir),
-            undefined=StrictUndefined,  # Raise errors for undefined variables
-        )
+    # Load and render the template
+    template = get_template_environment(template_dir).get_template(template_filename)
+    rendered_prompt = template.render()
 
-        # Load and render the template
-        template = env.get_template(template_filename)
-        rendered_prompt = template.render()
+    # Validate that the rendered prompt is not empty
+    if not rendered_prompt or not rendered_prompt.strip():
+        raise RuntimeError(f"Rendered system prompt is empty: {template_path}")
 
-        # Validate that the rendered prompt is not empty
-        if not rendered_prompt or not rendered_prompt.strip():
-            raise RuntimeError(f"Rendered system prompt is empty: {template_path}")
+    return rendered_prompt
 
-        return rendered_prompt
 
+def load_system_prompt(template_path: str) -> str:
+    """
+    Load system prompt from a Jinja2 template.
+
+    System prompts take no variables, so the rendered prompt is cached until
+    the template file changes.
+
+    Args:
+        template_path: Path to the system prompt template
+
+    Returns:
+        Rendered system prompt
+    """
+    # Validate template path; any stat failure means the template is unusable
+    try:
+        stat = os.stat(template_path)
+    except OSError:
+        raise FileNotFoundError(
+            f"System prompt template not found: {template_path}"
+        ) from None
+
+    try:
+        return _render_system_prompt(template_path, stat.st_mtime_ns, stat.st_size)
     except Exception as e:
         raise RuntimeError(
             f"Error loading system prompt template {template_path}: {str(e)}"
         ) from e
 
 
+def validate_generation_context(context: BaseGenerationContext) -> None:
+    """
+    Validate the fields required by every generator.
+
+    Args:
+        context: Generation context to validate
+
+    Raises:
+        ValueError: If the CV or job description is empty
+    """
+    if not context.cv or not context.cv.strip():
+        raise ValueError("CV text is required")
+    if not context.job_description or not context.job_description.strip():
+        raise ValueError("Job description is required")
+
+
+def validate_component_context(context: ComponentGenerationContext) -> None:
+    """
+    Validate the fields required by component generators.
+
+    Args:
+        context: Component generation context to validate
+
+    Raises:
+        ValueError: If the CV, job description or core competences are empty
+    """
+    validate_generation_context(context)
+    if not context.core_competences or not context.core_competences.strip():
+        raise ValueError("Core competences are required")
+
+
 def prepare_context(
     context_template_path: str, context: BaseGenerationContext, **extra_context: Any
 ) -> str:
@@ -72,11 +147,7 @@ def prepare_context(
         )
 
     try:
-        # Create Jinja2 environment
-        env = Environment(
-            loader=FileSystemLoader(os.path.dirname(context_template_path)),
-            undefined=StrictUndefined,  # Raise errors for undefined variables
-        )
+        env = get_template_environment(os.path.dirname(context_template_path))
         template = env.get_template(os.path.basename(context_template_path))
 
         # Prepare template context
@@ -0,0 +1,26 @@
+"""Common fixtures for all tests."""
+
+from typing import Generator
+
+import pytest
+from pydantic_ai import models
+
+from cv_adapter.dto.language import ENGLISH
+from cv_adapter.models.context import language_context
+
+
+@pytest.fixture(autouse=True)
+def block_model_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fail fast if a test reaches a real model provider instead of a mock."""
+    monkeypatch.setattr(models, "ALLOW_MODEL_REQUESTS", False)
+
+
+@pytest.fixture(scope="module")
+def english_context() -> Generator[None, None, None]:
+    """Run a test module in the English language context.
+
+    Modules opt in with ``pytestmark = pytest.mark.usefixtures("english_context")``.
+    Tests that need another language nest their own language_context().
+    """
+    with language_context(ENGLISH):
+        yield
@@ -0,0 +1,25 @@
+"""Common fixtures for application tests."""
+
+import pytest
+
+from cv_adapter.dto.cv import ContactDTO, PersonalInfoDTO
+
+
+@pytest.fixture(scope="session")
+def personal_info() -> PersonalInfoDTO:
+    """Fixture to provide sample personal info."""
+    return PersonalInfoDTO(
+        full_name="John Doe",
+        email=ContactDTO(
+            value="john@example.com",
+            type="email",
+            icon="email",
+            url="mailto:john@example.com",
+        ),
+        phone=ContactDTO(
+            value="+1234567890",
+            type="phone",
+            icon="phone",
+            url="tel:+1234567890",
+        ),
+    )
@@ -7,7 +7,6 @@ from pydantic_ai.models import KnownModelName
 from cv_adapter.core.application import CVAdapterApplication
 from cv_adapter.dto.cv import (
     CVDTO,
-    ContactDTO,
     CoreCompetenceDTO,
     EducationDTO,
     ExperienceDTO,
@@ -22,37 +21,16 @@ from cv_adapter.dto.language import ENGLISH
 from cv_adapter.models.context import language_context
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def detailed_cv_text() -> str:
     """Fixture to provide a sample CV text."""
     return "Existing CV text for John Doe"
 
 
-@pytest.fixture
-def personal_info() -> PersonalInfoDTO:
-    """Fixture to provide sample personal info."""
-    return PersonalInfoDTO(
-        full_name="John Doe",
-        email=ContactDTO(
-            value="john@example.com",
-            type="email",
-            icon="email",
-            url="mailto:john@example.com",
-        ),
-        phone=ContactDTO(
-            value="+1234567890",
-            type="phone",
-            icon="phone",
-            url="tel:+1234567890",
-        ),
-    )
-
-
-@pytest.fixture
-def async_app() -> Mock:
-    """Mock for the internal AsyncCVAdapterApplication."""
-    mock = AsyncMock()
-    mock_cv = CVDTO(
+@pytest.fixture(scope="session")
+def generated_cv() -> CVDTO:
+    """Fixture to provide the CV returned by the mocked async app."""
+    return CVDTO(
         personal_info=PersonalInfoDTO(full_name="John Doe"),
         title=TitleDTO(text="Senior Developer"),
         summary=SummaryDTO(text="Experienced developer"),
@@ -83,42 +61,41 @@ def async_app() -> Mock:
         ],
         language=ENGLISH,
     )
+
+
+@pytest.fixture
+def async_app(generated_cv: CVDTO) -> Mock:
+    """Mock for the internal AsyncCVAdapterApplication."""
+    mock = AsyncMock()
     mock_competences = [CoreCompetenceDTO(text="Python")]
-    # Create return values for each async method
+    # Child methods of an AsyncMock are awaitable and resolve to return_value
     mock.generate_core_competences.return_value = mock_competences
-    mock.generate_cv.return_value = mock_cv
-    mock.generate_cv_with_competences.return_value = mock_cv
-    # Set async method side effects to make the returns awaitable
-    mock.generate_core_competences.side_effect = AsyncMock(
-        return_value=mock_competences
-    )
-    mock.generate_cv.side_effect = AsyncMock(return_value=mock_cv)
-    mock.generate_cv_with_competences.side_effect = AsyncMock(return_value=mock_cv)
+    mock.generate_cv.return_value = generated_cv
+    mock.generate_cv_with_competences.return_value = generated_cv
     return mock
 
 
 @pytest.fixture
 def app(async_app: Mock) -> CVAdapterApplication:
-    """Fixture to create a CVAdapterApplication with mocked async app."""
-    with patch("pydantic_ai.models.openai.AsyncOpenAI"):
-        app = CVAdapterApplication(ai_model="openai:gpt-4o")
-        app._async_app = async_app
-        return app
+    """Fixture to create a CVAdapterApplication with mocked async app.
+
+    The mock is injected at construction, so no real generators are built.
+    """
+    with patch(
+        "cv_adapter.core.application.AsyncCVAdapterApplication",
+        return_value=async_app,
+    ):
+        return CVAdapterApplication(ai_model="openai:gpt-4o")
 
 
-def test_init_custom_ai_model() -> None:
+@pytest.mark.parametrize("model", ["openai:gpt-3.5-turbo", "openai:gpt-4o"])
+def test_init_custom_ai_model(model: KnownModelName) -> None:
     """Test application initialization with different AI models."""
     with patch("cv_adapter.core.application.AsyncCVAdapterApplication") as mock_class:
-        mock_instance = AsyncMock()
-        mock_class.return_value = mock_instance
-        with patch("pydantic_ai.models.openai.AsyncOpenAI"):
-            test_models: list[KnownModelName] = [
-                "openai:gpt-3.5-turbo",
-                "openai:gpt-4o",
-            ]  # type: ignore[list-item]
-            for model in test_models:
-                CVAdapterApplication(ai_model=model)
-                mock_class.assert_called_with(ai_model=model)
+        # The facade awaits _initialize_generators on the async app
+        mock_class.return_value = AsyncMock()
+        CVAdapterApplication(ai_model=model)
+    mock_class.assert_called_once_with(ai_model=model)
 
 
 def test_generate_cv_without_language_context(
@@ -162,7 +139,7 @@ def test_generate_core_competences(
     async_app.generate_core_competences.assert_called_once_with(
         cv_text=detailed_cv_text, job_description="job description", notes="notes"
     )
-    assert result == async_app.generate_core_competences.return_value
+    assert result is async_app.generate_core_competences.return_value
 
 
 def test_generate_cv_with_competences(
@@ -190,7 +167,7 @@ def test_generate_cv_with_competences(
         core_competences=competences,
         notes="notes",
     )
-    assert result == async_app.generate_cv_with_competences.return_value
+    assert result is async_app.generate_cv_with_competences.return_value
 
 
 def test_generate_cv(
@@ -214,4 +191,4 @@ def test_generate_cv(
         personal_info=personal_info,
         notes="notes",
     )
-    assert result == async_app.generate_cv.return_value
+    assert result is async_app.generate_cv.return_value
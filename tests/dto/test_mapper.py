@@ -1,7 +1,9 @@
 """Tests for the DTO mapper."""
 
 from datetime import date
-from typing import Any, Callable, Dict
+from typing import Any, Dict
+
+import pytest
 
 from cv_adapter.dto.cv import (
     CVDTO,
@@ -44,20 +46,10 @@ from cv_adapter.models.components import (
     Title,
     University,
 )
-from cv_adapter.models.context import language_context
-
-
-def with_language_context(func: Callable[..., Any]) -> Callable[..., Any]:
-    """Decorator to wrap a test function with a language context."""
 
-    def wrapper(*args: Any, **kwargs: Any) -> Any:
-        with language_context(ENGLISH):
-            return func(*args, **kwargs)
+pytestmark = pytest.mark.usefixtures("english_context")
 
-    return wrapper
 
-
-@with_language_context
 def test_map_core_competence() -> None:
     """Test mapping a single core competence."""
     core_competence = CoreCompetence(text="Innovative problem-solving")
@@ -67,7 +59,6 @@ def test_map_core_competence() -> None:
     assert dto.text == "Innovative problem-solving"
 
 
-@with_language_context
 def test_map_core_competences() -> None:
     """Test mapping a collection of core competences."""
     core_competences = CoreCompetences(
@@ -88,7 +79,6 @@ def test_map_core_competences() -> None:
     assert dto[3].text == "Technical leadership"
 
 
-@with_language_context
 def test_map_institution() -> None:
     """Test mapping an institution."""
     institution = University(
@@ -104,7 +94,6 @@ def test_map_institution() -> None:
     assert dto.location == "San Francisco, CA"
 
 
-@with_language_context
 def test_map_experience() -> None:
     """Test mapping a professional experience."""
     experience = Experience(
@@ -130,7 +119,6 @@ def test_map_experience() -> None:
     assert dto.company.name == "Tech Innovations Inc."
 
 
-@with_language_context
 def test_map_education() -> None:
     """Test mapping an educational experience."""
     education = Education(
@@ -154,7 +142,6 @@ def test_map_education() -> None:
     assert dto.university.name == "Stanford University"
 
 
-@with_language_context
 def test_map_skill() -> None:
     """Test mapping a single skill."""
     skill = Skill(text="Python")
@@ -164,7 +151,6 @@ def test_map_skill() -> None:
     assert dto.text == "Python"
 
 
-@with_language_context
 def test_map_skill_group() -> None:
     """Test mapping a skill group."""
     skill_group = SkillGroup(
@@ -180,7 +166,6 @@ def test_map_skill_group() -> None:
     assert dto.skills[1].text == "JavaScript"
 
 
-@with_language_context
 def test_map_skills() -> None:
     """Test mapping skills."""
     skills = Skills(
@@ -203,7 +188,6 @@ def test_map_skills() -> None:
     assert dto[1].name == "Frameworks"
 
 
-@with_language_context
 def test_map_title() -> None:
     """Test mapping a professional title."""
     title = Title(text="Innovative Software Engineer")
@@ -213,7 +197,6 @@ def test_map_title() -> None:
     assert dto.text == "Innovative Software Engineer"
 
 
-@with_language_context
 def test_map_summary() -> None:
     """Test mapping a summary."""
     summary = CVSummary(
@@ -227,57 +210,55 @@ def test_map_summary() -> None:
 
 def create_minimal_cv_dict() -> Dict[str, Any]:
     """Helper function to create a minimal CV dictionary."""
-    with language_context(ENGLISH):
-        return {
-            "title": Title(text="Innovative Software Engineer"),
-            "core_competences": CoreCompetences(
-                items=[
-                    CoreCompetence(text="Innovative problem-solving"),
-                    CoreCompetence(text="Strategic planning"),
-                    CoreCompetence(text="Cross-functional collaboration"),
-                    CoreCompetence(text="Technical leadership"),
-                ]
-            ),
-            "experiences": [
-                Experience(
-                    company=Company(
-                        name="Tech Innovations Inc.",
-                        description="Innovative tech company",
-                        location="San Francisco, CA",
-                    ),
-                    position="Senior Software Engineer",
-                    start_date=date(2020, 1, 1),
-                    end_date=date(2023, 12, 31),
-                    description="Led development of innovative solutions",
-                    technologies=["Python", "React"],
-                )
-            ],
-            "education": [
-                Education(
-                    university=University(
-                        name="Stanford University",
-                        description="Top-tier research university",
-                        location="Stanford, CA",
-                    ),
-                    degree="Master of Science in Computer Science",
-                    start_date=date(2018, 9, 1),
-                    end_date=date(2020, 6, 30),
-                    description="Advanced software engineering",
+    return {
+        "title": Title(text="Innovative Software Engineer"),
+        "core_competences": CoreCompetences(
+            items=[
+                CoreCompetence(text="Innovative problem-solving"),
+                CoreCompetence(text="Strategic planning"),
+                CoreCompetence(text="Cross-functional collaboration"),
+                CoreCompetence(text="Technical leadership"),
+            ]
+        ),
+        "experiences": [
+            Experience(
+                company=Company(
+                    name="Tech Innovations Inc.",
+                    description="Innovative tech company",
+                    location="San Francisco, CA",
+                ),
+                position="Senior Software Engineer",
+                start_date=date(2020, 1, 1),
+                end_date=date(2023, 12, 31),
+                description="Led development of innovative solutions",
+                technologies=["Python", "React"],
+            )
+        ],
+        "education": [
+            Education(
+                university=University(
+                    name="Stanford University",
+                    description="Top-tier research university",
+                    location="Stanford, CA",
+                ),
+                degree="Master of Science in Computer Science",
+                start_date=date(2018, 9, 1),
+                end_date=date(2020, 6, 30),
+                description="Advanced software engineering",
+            )
+        ],
+        "skills": Skills(
+            groups=[
+                SkillGroup(
+                    name="Programming Languages",
+                    skills=[Skill(text="Python"), Skill(text="JavaScript")],
                 )
-            ],
-            "skills": Skills(
-                groups=[
-                    SkillGroup(
-                        name="Programming Languages",
-                        skills=[Skill(text="Python"), Skill(text="JavaScript")],
-                    )
-                ]
-            ),
-            "language": ENGLISH,
-        }
+            ]
+        ),
+        "language": ENGLISH,
+    }
 
 
-@with_language_context
 def test_map_minimal_cv() -> None:
     """Test mapping a minimal CV."""
     minimal_cv_dict = create_minimal_cv_dict()
@@ -299,7 +280,6 @@ def test_map_minimal_cv() -> None:
     assert dto.language == ENGLISH
 
 
-@with_language_context
 def test_map_cv() -> None:
     """Test mapping a complete CV."""
     cv_dict = {
@@ -27,6 +27,15 @@ def test_language_enum_values() -> None:
     assert str(ITALIAN) == "it"
 
 
+def test_language_equality() -> None:
+    """Test that languages compare and hash by code."""
+    assert ENGLISH == ENGLISH
+    assert ENGLISH != FRENCH
+    assert Language.model_validate_json('{"code": "de"}') == GERMAN
+    assert hash(Language.model_validate_json('{"code": "es"}')) == hash(SPANISH)
+    assert ENGLISH != "en"
+
+
 def test_detect_language_english() -> None:
     """Test detecting English text."""
     text = "This is a sample text in English with some technical terms."
@@ -40,3 +40,14 @@ def test_get_current_language_without_context() -> None:
     with pytest.raises(RuntimeError) as exc_info:
         get_current_language()
     assert "Language context not set" in str(exc_info.value)
+
+
+def test_reentering_same_language_keeps_context() -> None:
+    """Test that re-entering the active language is a no-op."""
+    with language_context(FRENCH):
+        with language_context(FRENCH):
+            assert get_current_language() == FRENCH
+        assert get_current_language() == FRENCH
+
+    with pytest.raises(RuntimeError):
+        get_current_language()
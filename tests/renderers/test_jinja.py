@@ -23,7 +23,7 @@ from cv_adapter.dto.language import ENGLISH
 from cv_adapter.renderers import Jinja2Renderer, RendererError, RenderingConfig
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_cv_dto() -> CVDTO:
     """Create a sample CV DTO for testing."""
     return CVDTO(
@@ -89,7 +89,7 @@ def sample_cv_dto() -> CVDTO:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_minimal_cv_dto() -> MinimalCVDTO:
     """Create a sample MinimalCVDTO for testing."""
     return MinimalCVDTO(
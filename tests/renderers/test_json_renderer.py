@@ -22,7 +22,7 @@ from cv_adapter.renderers.base import RendererError
 from cv_adapter.renderers.json_renderer import JSONRenderer
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_cv() -> CVDTO:
     return CVDTO(
         personal_info=PersonalInfoDTO(
@@ -65,7 +65,7 @@ def test_core_competences_renderer_to_markdown() -> None:
     assert result == "* Leadership\n* Problem Solving"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_cv_dto() -> CVDTO:
     """Create a sample CV DTO for testing."""
     return CVDTO(
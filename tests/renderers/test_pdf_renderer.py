@@ -25,7 +25,7 @@ from cv_adapter.dto.language import ENGLISH
 from cv_adapter.renderers import PDFRenderer, RendererError, TypstRenderer
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_cv() -> CVDTO:
     """Create a sample CV for testing."""
     return CVDTO(
@@ -22,7 +22,7 @@ from cv_adapter.renderers.base import RendererError
 from cv_adapter.renderers.yaml_renderer import YAMLRenderer
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_cv() -> CVDTO:
     return CVDTO(
         personal_info=PersonalInfoDTO(
@@ -90,6 +90,20 @@ def test_yaml_renderer_to_string(sample_cv: CVDTO, tmp_path: Path) -> None:
     assert data["title"]["text"] == "Senior Software Engineer"
 
 
+def test_yaml_renderer_keeps_unicode_readable(sample_cv: CVDTO) -> None:
+    # Emoji and non-ASCII text stay literal instead of \U escapes
+    cv = sample_cv.model_copy(
+        update={
+            "title": TitleDTO(text="Ingénieur logiciel 🙂"),
+            "summary": SummaryDTO(text="Développeur: back-end 🙂"),
+        }
+    )
+    yaml_str = YAMLRenderer().render_to_string(cv)
+
+    assert "title:\n  text: Ingénieur logiciel 🙂\n" in yaml_str
+    assert "summary:\n  text: 'Développeur: back-end 🙂'\n" in yaml_str
+
+
 def test_yaml_renderer_to_file(sample_cv: CVDTO, tmp_path: Path) -> None:
     renderer = YAMLRenderer()
     file_path = tmp_path / "cv.yaml"
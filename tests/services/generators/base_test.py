@@ -1,4 +1,4 @@
-"""Base test class for generator tests.
+"""Shared generator specs and validation cases for generator tests.
 
 IMPORTANT: All test cases must use ai_model="test" when creating generator instances.
 This ensures tests don't require real API keys and work reliably in all environments.
@@ -6,72 +6,210 @@ See: https://ai.pydantic.dev/testing-evals/?h#unit-testing-with-testmodel
 """
 
 import os
-from typing import Any, Generic, TypeVar
+import re
+from dataclasses import dataclass
+from datetime import date
+from functools import cached_property, partial
+from importlib.resources import files
+from types import ModuleType
+from typing import Any, Awaitable, Callable
 
 import pytest
 
-from cv_adapter.services.generators.protocols import (
-    AsyncGenerator,
-    BaseGenerationContext,
+from cv_adapter.dto.cv import (
+    CoreCompetenceDTO,
+    EducationDTO,
+    ExperienceDTO,
+    InstitutionDTO,
+    SkillDTO,
+    SkillGroupDTO,
+    SummaryDTO,
+    TitleDTO,
+)
+from cv_adapter.renderers.markdown import MinimalMarkdownRenderer
+from cv_adapter.services import generators
+from cv_adapter.services.generators import (
+    competence_generator,
+    education_generator,
+    experience_generator,
+    skills_generator,
+    summary_generator,
+    title_generator,
+)
+from cv_adapter.services.generators.protocols import AsyncGenerator
+
+# Valid generation context fields; validation cases override one of them
+VALID_COMPETENCE_CONTEXT: dict[str, Any] = {
+    "cv": "Test CV",
+    "job_description": "Test job",
+    "notes": None,
+}
+VALID_COMPONENT_CONTEXT: dict[str, Any] = {
+    **VALID_COMPETENCE_CONTEXT,
+    "core_competences": "Test competences",
+}
+
+# Validation error patterns, compiled once for pytest.raises(match=...)
+CV_REQUIRED = re.compile("CV text is required")
+JOB_DESCRIPTION_REQUIRED = re.compile("Job description is required")
+CORE_COMPETENCES_REQUIRED = re.compile("Core competences are required")
+
+COMPETENCE_VALIDATION_CASES = [
+    pytest.param({"cv": ""}, CV_REQUIRED, id="empty-cv"),
+    pytest.param({"cv": "   "}, CV_REQUIRED, id="blank-cv"),
+    pytest.param({"job_description": ""}, JOB_DESCRIPTION_REQUIRED, id="empty-job"),
+]
+COMPONENT_VALIDATION_CASES = [
+    *COMPETENCE_VALIDATION_CASES,
+    pytest.param(
+        {"core_competences": ""}, CORE_COMPETENCES_REQUIRED, id="empty-competences"
+    ),
+]
+
+
+# Default generator templates as package resources, resolved at import
+TEMPLATES = files(generators) / "templates"
+TEMPLATES_DIR = str(TEMPLATES)
+
+
+@dataclass(frozen=True)
+class GeneratorSpec:
+    """Description of a generator exercised by shared tests."""
+
+    name: str
+    factory: Callable[..., Awaitable[AsyncGenerator]]
+    module: ModuleType
+    template_names: tuple[str, str]
+    payload_fixture: str  # Fixture providing the agent result data
+    expected: Any  # Generator output for the agent result data, as literal DTOs
+    language_instruction: str  # Prefix of the language requirement in the context
+
+    @cached_property
+    def default_template_paths(self) -> dict[str, str]:
+        """Paths to the generator's default templates, resolved once per spec."""
+        system_prompt, context = self.template_names
+        return {
+            "system_prompt": os.path.join(TEMPLATES_DIR, system_prompt),
+            "context": os.path.join(TEMPLATES_DIR, context),
+        }
+
+
+COMPETENCE_SPEC = GeneratorSpec(
+    name="competence",
+    factory=competence_generator.create_core_competence_generator,
+    module=competence_generator,
+    template_names=("competence_system_prompt.j2", "competence_context.j2"),
+    payload_fixture="sample_competences_payload",
+    language_instruction="Generate all competences in",
+    expected=[
+        CoreCompetenceDTO(text="Technical Leadership"),
+        CoreCompetenceDTO(text="Full Stack Development"),
+        CoreCompetenceDTO(text="Software Architecture"),
+        CoreCompetenceDTO(text="Agile Project Management"),
+    ],
 )
 
-TContext = TypeVar("TContext", bound=BaseGenerationContext)
-
-
-class BaseGeneratorTest(Generic[TContext]):
-    """Base class for generator tests with common test patterns."""
-
-    generator_type: type[AsyncGenerator] = AsyncGenerator
-    default_template_dir: str = ""  # To be set by child classes
-
-    async def create_generator(self, **kwargs: Any) -> AsyncGenerator:
-        """Create generator instance. To be implemented by child classes."""
-        raise NotImplementedError
-
-    def get_default_template_paths(self) -> dict[str, str]:
-        """Get paths to default templates. To be implemented by child classes."""
-        raise NotImplementedError
+EDUCATION_SPEC = GeneratorSpec(
+    name="education",
+    factory=education_generator.create_education_generator,
+    module=education_generator,
+    template_names=("education_system_prompt.j2", "education_context.j2"),
+    payload_fixture="sample_education_payload",
+    language_instruction="Generate the education section in",
+    expected=[
+        EducationDTO(
+            university=InstitutionDTO(
+                name="Tech University",
+                description="Leading technology and engineering institution",
+                location="San Francisco, CA",
+            ),
+            degree="Master of Science in Computer Science",
+            start_date=date(2018, 9, 1),
+            end_date=date(2020, 5, 15),
+            description="Specialized in machine learning and AI technologies",
+        )
+    ],
+)
 
-    def get_invalid_context(self) -> TContext:
-        """Get invalid context for validation tests.
+EXPERIENCE_SPEC = GeneratorSpec(
+    name="experience",
+    factory=experience_generator.create_experience_generator,
+    module=experience_generator,
+    template_names=("experience_system_prompt.j2", "experience_context.j2"),
+    payload_fixture="sample_experience_payload",
+    language_instruction="Generate all content in",
+    expected=[
+        ExperienceDTO(
+            company=InstitutionDTO(
+                name="Tech Corp",
+                description="Leading technology company",
+                location="San Francisco",
+            ),
+            position="Senior Software Engineer",
+            start_date=date(2020, 1, 1),
+            end_date=date(2023, 1, 1),
+            description="Led development of cloud-native applications",
+            technologies=["Python", "Docker", "Kubernetes"],
+        )
+    ],
+)
 
-        To be implemented by child classes.
-        """
-        raise NotImplementedError
+SKILLS_SPEC = GeneratorSpec(
+    name="skills",
+    factory=skills_generator.create_skills_generator,
+    module=skills_generator,
+    template_names=("skills_system_prompt.j2", "skills_context.j2"),
+    payload_fixture="sample_skills_payload",
+    language_instruction="Generate skills in",
+    expected=[
+        SkillGroupDTO(
+            name="Programming Languages",
+            skills=[
+                SkillDTO(text="Python"),
+                SkillDTO(text="JavaScript"),
+                SkillDTO(text="TypeScript"),
+            ],
+        ),
+        SkillGroupDTO(
+            name="Frameworks",
+            skills=[
+                SkillDTO(text="React"),
+                SkillDTO(text="Django"),
+                SkillDTO(text="FastAPI"),
+            ],
+        ),
+    ],
+)
 
-    @pytest.mark.asyncio
-    async def test_generator_creation(self) -> None:
-        """Test generator creation."""
-        generator = await self.create_generator(ai_model="test")
-        assert isinstance(generator, AsyncGenerator)
+SUMMARY_SPEC = GeneratorSpec(
+    name="summary",
+    factory=partial(
+        summary_generator.create_summary_generator,
+        renderer=MinimalMarkdownRenderer(),
+    ),
+    module=summary_generator,
+    template_names=("summary_system_prompt.j2", "summary_context.j2"),
+    payload_fixture="sample_summary_payload",
+    language_instruction="Generate the summary in",
+    expected=SummaryDTO(
+        text="Experienced software engineer specialized in full-stack development"
+    ),
+)
 
-    @pytest.mark.asyncio
-    async def test_default_templates(self) -> None:
-        """Test default templates existence and loading."""
-        templates = self.get_default_template_paths()
-        for path in templates.values():
-            assert os.path.exists(path), f"Template not found: {path}"
+TITLE_SPEC = GeneratorSpec(
+    name="title",
+    factory=title_generator.create_title_generator,
+    module=title_generator,
+    template_names=("title_system_prompt.j2", "title_context.j2"),
+    payload_fixture="sample_title_payload",
+    language_instruction="Generate the title in",
+    expected=TitleDTO(text="Senior Software Engineer"),
+)
 
-        generator = await self.create_generator(
-            ai_model="test",
-            system_prompt_template_path=templates["system_prompt"],
-            context_template_path=templates["context"],
-        )
-        assert generator is not None
-
-    @pytest.mark.asyncio
-    async def test_custom_templates(self, template_paths: dict[str, str]) -> None:
-        """Test custom templates support."""
-        generator = await self.create_generator(
-            ai_model="test",
-            system_prompt_template_path=template_paths["system_prompt"],
-            context_template_path=template_paths["context"],
-        )
-        assert generator is not None
-
-    @pytest.mark.asyncio
-    async def test_validation(self) -> None:
-        """Test input validation."""
-        generator = await self.create_generator(ai_model="test")
-        with pytest.raises(ValueError):
-            await generator(self.get_invalid_context())
+COMPONENT_GENERATOR_SPECS = [
+    EDUCATION_SPEC,
+    EXPERIENCE_SPEC,
+    SKILLS_SPEC,
+    SUMMARY_SPEC,
+    TITLE_SPEC,
+]
@@ -1,19 +1,61 @@
 """Common fixtures for generator tests."""
 
-from contextlib import AbstractContextManager
-from typing import Any, Generator
-from unittest.mock import AsyncMock
+from datetime import date
 
 import pytest
-from pydantic_ai import Agent
 
 from cv_adapter.dto.language import ENGLISH
+from cv_adapter.models.components import (
+    CoreCompetence,
+    CoreCompetences,
+    CVSummary,
+    Education,
+    Experience,
+    Skill,
+    SkillGroup,
+    Title,
+    University,
+)
+from cv_adapter.models.components.experience import Company
 from cv_adapter.models.context import language_context
 from cv_adapter.services.generators.protocols import (
+    AsyncGenerator,
+    BaseGenerationContext,
     ComponentGenerationContext,
     CoreCompetenceGenerationContext,
 )
 
+from .base_test import (
+    COMPETENCE_SPEC,
+    COMPONENT_GENERATOR_SPECS,
+    VALID_COMPETENCE_CONTEXT,
+    VALID_COMPONENT_CONTEXT,
+    GeneratorSpec,
+)
+
+
+@pytest.fixture(
+    scope="session", params=COMPONENT_GENERATOR_SPECS, ids=lambda spec: spec.name
+)
+def generator_spec(request: pytest.FixtureRequest) -> GeneratorSpec:
+    """Provide the spec of the component generator under test."""
+    return request.param  # type: ignore[no-any-return]
+
+
+@pytest.fixture(scope="session")
+async def component_generator(generator_spec: GeneratorSpec) -> AsyncGenerator:
+    """Create a component generator shared by tests that do not patch Agent.
+
+    Session scope builds one agent per spec on each xdist worker.
+    """
+    return await generator_spec.factory(ai_model="test")
+
+
+@pytest.fixture(scope="session")
+async def competence_generator() -> AsyncGenerator:
+    """Create the competence generator shared by tests that do not patch Agent."""
+    return await COMPETENCE_SPEC.factory(ai_model="test")
+
 
 @pytest.fixture
 def base_context() -> ComponentGenerationContext:
@@ -28,48 +70,155 @@ def base_context() -> ComponentGenerationContext:
     )
 
 
-@pytest.fixture
-def competence_context() -> CoreCompetenceGenerationContext:
-    """Create test context for competence generator."""
-    return CoreCompetenceGenerationContext(
-        cv="Experienced software engineer with diverse technical skills",
-        job_description=(
-            "Seeking a senior software engineer with full-stack development skills"
-        ),
-        notes=None,
-    )
+@pytest.fixture(scope="session")
+def generation_context() -> BaseGenerationContext:
+    """Create a base generation context with a realistic Markdown CV."""
+    return BaseGenerationContext(
+        cv="""# John Doe
 
+## Professional Summary
+Experienced software engineer with a strong background in Python development.
 
-@pytest.fixture
-def mock_agent() -> Generator[AsyncMock, None, None]:
-    """Create a mock agent with async run method."""
-    mock = AsyncMock()
-    mock.run = AsyncMock()
-    yield mock
-
+## Work Experience
+### Software Engineer at Tech Company
+- Developed scalable web applications
+- Implemented efficient backend solutions
 
-@pytest.fixture
-def mock_agent_factory(mock_agent: AsyncMock) -> Generator[Any, None, None]:
-    """Create a mock agent factory."""
+## Education
+### Computer Science Degree
+University of Technology, 2016-2020
 
-    def factory(*args: Any, **kwargs: Any) -> Agent[Any, Any]:
-        return mock_agent
-
-    yield factory
-
-
-@pytest.fixture
-def language_ctx() -> Generator[AbstractContextManager[None], None, None]:
-    """Set up English language context."""
-    ctx = language_context(ENGLISH)
-    yield ctx
+## Skills
+- Python
+- Backend Development
+- Cloud Computing""",
+        job_description="Senior Software Engineer position at Innovative Tech",
+        notes="Test context for CV generation",
+    )
 
 
-@pytest.fixture
-def template_paths(tmp_path: Any) -> dict[str, str]:
-    """Create and manage test template paths."""
-    system_prompt_path = tmp_path / "system_prompt.j2"
-    context_path = tmp_path / "context.j2"
+@pytest.fixture(scope="session")
+def component_context(request: pytest.FixtureRequest) -> ComponentGenerationContext:
+    """Create a component context from the valid fields and indirect overrides.
+
+    Session scope builds each parametrized context once and shares it across
+    generator specs.
+    """
+    overrides = getattr(request, "param", {})
+    return ComponentGenerationContext(**{**VALID_COMPONENT_CONTEXT, **overrides})
+
+
+@pytest.fixture(scope="session")
+def competence_context(
+    request: pytest.FixtureRequest,
+) -> CoreCompetenceGenerationContext:
+    """Create a competence context from the valid fields and indirect overrides."""
+    overrides = getattr(request, "param", {})
+    return CoreCompetenceGenerationContext(**{**VALID_COMPETENCE_CONTEXT, **overrides})
+
+
+@pytest.fixture(scope="session")
+def sample_competences_payload() -> CoreCompetences:
+    """Create the core competences returned by mocked competence agents."""
+    with language_context(ENGLISH):
+        return CoreCompetences(
+            items=[
+                CoreCompetence(text="Technical Leadership"),
+                CoreCompetence(text="Full Stack Development"),
+                CoreCompetence(text="Software Architecture"),
+                CoreCompetence(text="Agile Project Management"),
+            ]
+        )
+
+
+@pytest.fixture(scope="session")
+def sample_education_payload() -> list[Education]:
+    """Create the education entries returned by mocked education agents."""
+    with language_context(ENGLISH):
+        return [
+            Education(
+                university=University(
+                    name="Tech University",
+                    description="Leading technology and engineering institution",
+                    location="San Francisco, CA",
+                ),
+                degree="Master of Science in Computer Science",
+                start_date=date(2018, 9, 1),
+                end_date=date(2020, 5, 15),
+                description="Specialized in machine learning and AI technologies",
+            )
+        ]
+
+
+@pytest.fixture(scope="session")
+def sample_experience_payload() -> list[Experience]:
+    """Create the experience entries returned by mocked experience agents."""
+    with language_context(ENGLISH):
+        return [
+            Experience(
+                company=Company(
+                    name="Tech Corp",
+                    description="Leading technology company",
+                    location="San Francisco",
+                ),
+                position="Senior Software Engineer",
+                start_date=date(2020, 1, 1),
+                end_date=date(2023, 1, 1),
+                description="Led development of cloud-native applications",
+                technologies=["Python", "Docker", "Kubernetes"],
+            )
+        ]
+
+
+@pytest.fixture(scope="session")
+def sample_skills_payload() -> list[SkillGroup]:
+    """Create the skill groups returned by mocked skills agents."""
+    with language_context(ENGLISH):
+        return [
+            SkillGroup(
+                name="Programming Languages",
+                skills=[
+                    Skill(text="Python"),
+                    Skill(text="JavaScript"),
+                    Skill(text="TypeScript"),
+                ],
+            ),
+            SkillGroup(
+                name="Frameworks",
+                skills=[
+                    Skill(text="React"),
+                    Skill(text="Django"),
+                    Skill(text="FastAPI"),
+                ],
+            ),
+        ]
+
+
+@pytest.fixture(scope="session")
+def sample_summary_payload() -> CVSummary:
+    """Create the summary returned by mocked summary agents."""
+    with language_context(ENGLISH):
+        return CVSummary(
+            text="Experienced software engineer specialized in full-stack development"
+        )
+
+
+@pytest.fixture(scope="session")
+def sample_title_payload() -> Title:
+    """Create the title returned by mocked title agents."""
+    with language_context(ENGLISH):
+        return Title(text="Senior Software Engineer")
+
+
+@pytest.fixture(scope="session")
+def template_paths(tmp_path_factory: pytest.TempPathFactory) -> dict[str, str]:
+    """Create custom test templates once and share them across tests.
+
+    Tests only read these templates; none may modify them.
+    """
+    template_dir = tmp_path_factory.mktemp("templates")
+    system_prompt_path = template_dir / "system_prompt.j2"
+    context_path = template_dir / "context.j2"
 
     # Create default test templates
     system_prompt_path.write_text("Test system prompt template")
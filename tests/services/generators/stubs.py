@@ -0,0 +1,32 @@
+"""Lightweight test doubles for pydantic-ai agents."""
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class StubResult:
+    """Agent run result carrying fixed data."""
+
+    data: Any
+
+
+class StubAgent:
+    """Minimal stand-in for ``pydantic_ai.Agent`` returning a fixed result.
+
+    Patch a generator module's ``Agent`` with :meth:`factory` so the generator
+    receives this instance, then inspect :attr:`run_calls` to verify usage.
+    """
+
+    def __init__(self, result: Any = None) -> None:
+        self.result = StubResult(result)
+        self.run_calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+
+    def factory(self, *args: Any, **kwargs: Any) -> "StubAgent":
+        """Return this stub in place of constructing a new agent."""
+        return self
+
+    async def run(self, *args: Any, **kwargs: Any) -> StubResult:
+        """Record the call and return the fixed result."""
+        self.run_calls.append((args, kwargs))
+        return self.result
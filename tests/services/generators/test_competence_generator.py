@@ -1,116 +1,101 @@
 """Tests for core competence generator."""
 
-import os
-from contextlib import AbstractContextManager
-from typing import Any
-from unittest.mock import AsyncMock, Mock
+import re
 
 import pytest
 
-from cv_adapter.dto.cv import CoreCompetenceDTO
-from cv_adapter.models.components import CoreCompetence, CoreCompetences
-from cv_adapter.services.generators.competence_generator import (
-    create_core_competence_generator,
-)
+from cv_adapter.dto.language import FRENCH
+from cv_adapter.models.components import CoreCompetences
+from cv_adapter.models.context import language_context
 from cv_adapter.services.generators.protocols import (
     AsyncGenerator,
     CoreCompetenceGenerationContext,
 )
+from cv_adapter.services.generators.utils import prepare_context
+
+from .base_test import (
+    COMPETENCE_SPEC,
+    COMPETENCE_VALIDATION_CASES,
+    TEMPLATES,
+)
+from .stubs import StubAgent
 
-from .base_test import BaseGeneratorTest
+pytestmark = pytest.mark.usefixtures("english_context")
 
 
-class TestCompetenceGenerator(BaseGeneratorTest[CoreCompetenceGenerationContext]):
+class TestCompetenceGenerator:
     """Test cases for core competence generator."""
 
-    generator_type = AsyncGenerator
-    default_template_dir = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
-        "cv_adapter",
-        "services",
-        "generators",
-        "templates",
-    )
+    def test_generator_creation(self, competence_generator: AsyncGenerator) -> None:
+        """Test generator creation."""
+        assert isinstance(competence_generator, AsyncGenerator)
+
+    @pytest.mark.asyncio
+    async def test_default_templates(self) -> None:
+        """Test default templates existence and loading."""
+        for name in COMPETENCE_SPEC.template_names:
+            assert TEMPLATES.joinpath(name).is_file(), f"Template not found: {name}"
+
+        templates = COMPETENCE_SPEC.default_template_paths
+        generator = await COMPETENCE_SPEC.factory(
+            ai_model="test",
+            system_prompt_template_path=templates["system_prompt"],
+            context_template_path=templates["context"],
+        )
+        assert generator is not None
 
-    async def create_generator(self, **kwargs: Any) -> AsyncGenerator:
-        """Create competence generator instance."""
-        return await create_core_competence_generator(**kwargs)
-
-    def get_default_template_paths(self) -> dict[str, str]:
-        """Get paths to default templates."""
-        return {
-            "system_prompt": os.path.join(
-                self.default_template_dir, "competence_system_prompt.j2"
-            ),
-            "context": os.path.join(self.default_template_dir, "competence_context.j2"),
-        }
-
-    def get_invalid_context(self) -> CoreCompetenceGenerationContext:
-        """Get invalid context for validation tests."""
-        return CoreCompetenceGenerationContext(
-            cv="",  # Invalid: empty CV
-            job_description="Test job",
-            notes=None,
+    @pytest.mark.asyncio
+    async def test_custom_templates(self, template_paths: dict[str, str]) -> None:
+        """Test custom templates support."""
+        generator = await COMPETENCE_SPEC.factory(
+            ai_model="test",
+            system_prompt_template_path=template_paths["system_prompt"],
+            context_template_path=template_paths["context"],
         )
+        assert generator is not None
 
     @pytest.mark.asyncio
     async def test_competence_generation(
         self,
-        mock_agent: AsyncMock,
-        mock_agent_factory: Any,
         competence_context: CoreCompetenceGenerationContext,
-        language_ctx: AbstractContextManager[None],
+        sample_competences_payload: CoreCompetences,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        """Test competence generation with mocked agent."""
-        with language_ctx:
-            # Configure mock agent response
-            mock_competences = CoreCompetences(
-                items=[
-                    CoreCompetence(text="Technical Leadership"),
-                    CoreCompetence(text="Full Stack Development"),
-                    CoreCompetence(text="Software Architecture"),
-                    CoreCompetence(text="Agile Project Management"),
-                ]
-            )
-            mock_agent.run.return_value = Mock(data=mock_competences)
-
-            # Patch the Agent class
-            from cv_adapter.services.generators import competence_generator as cg
+        """Test competence generation with a stubbed agent."""
+        agent = StubAgent(result=sample_competences_payload)
+        monkeypatch.setattr(COMPETENCE_SPEC.module, "Agent", agent.factory)
 
-            original_agent = getattr(cg, "Agent")
-            setattr(cg, "Agent", mock_agent_factory)
+        generator = await COMPETENCE_SPEC.factory(ai_model="test")
+        result = await generator(competence_context)
 
-            try:
-                # Create generator and generate competences
-                generator = await self.create_generator(ai_model="test")
-                result = await generator(competence_context)
-
-                # Verify the result
-                assert isinstance(result, list)
-                assert len(result) == 4
-                assert all(isinstance(comp, CoreCompetenceDTO) for comp in result)
-
-                # Verify specific values from mock
-                assert result[0].text == "Technical Leadership"
-                assert result[1].text == "Full Stack Development"
-                assert result[2].text == "Software Architecture"
-                assert result[3].text == "Agile Project Management"
-
-                # Verify agent was called
-                mock_agent.run.assert_called_once()
-            finally:
-                # Restore the original Agent class
-                setattr(cg, "Agent", original_agent)
+        # Compare with literal DTOs so mapping regressions are caught
+        assert result == COMPETENCE_SPEC.expected
+        assert len(agent.run_calls) == 1
 
     @pytest.mark.asyncio
-    async def test_competence_generator_validation_job_description(self) -> None:
-        """Test competence generator validation for job description."""
-        generator = await self.create_generator(ai_model="test")
-        with pytest.raises(ValueError, match="Job description is required"):
-            await generator(
-                CoreCompetenceGenerationContext(
-                    cv="Test CV",
-                    job_description="",  # Invalid: empty job description
-                    notes=None,
-                )
+    @pytest.mark.parametrize(
+        "competence_context, match",
+        COMPETENCE_VALIDATION_CASES,
+        indirect=["competence_context"],
+    )
+    async def test_validation(
+        self,
+        competence_generator: AsyncGenerator,
+        competence_context: CoreCompetenceGenerationContext,
+        match: re.Pattern[str],
+    ) -> None:
+        """Test generator validation for required parameters."""
+        with pytest.raises(ValueError, match=match):
+            await competence_generator(competence_context)
+
+    def test_context_preparation(
+        self, competence_context: CoreCompetenceGenerationContext
+    ) -> None:
+        """Test the language requirement in the default context template."""
+        with language_context(FRENCH):
+            context = prepare_context(
+                COMPETENCE_SPEC.default_template_paths["context"], competence_context
             )
+
+        assert competence_context.cv in context
+        assert f"{COMPETENCE_SPEC.language_instruction} French" in context
@@ -0,0 +1,154 @@
+"""Shared tests for component generators driven by generator specs."""
+
+import re
+
+import pytest
+
+from cv_adapter.dto.language import (
+    ENGLISH,
+    FRENCH,
+    GERMAN,
+    ITALIAN,
+    SPANISH,
+    Language,
+    LanguageConfig,
+)
+from cv_adapter.models.context import language_context
+from cv_adapter.services.generators.protocols import (
+    AsyncGenerator,
+    ComponentGenerationContext,
+)
+from cv_adapter.services.generators.utils import prepare_context
+
+from .base_test import (
+    COMPONENT_VALIDATION_CASES,
+    TEMPLATES,
+    GeneratorSpec,
+)
+from .stubs import StubAgent
+
+pytestmark = pytest.mark.usefixtures("english_context")
+
+# Language names as rendered in the language requirements of context templates
+LANGUAGE_NAMES = {
+    language: LanguageConfig.get(language.code).name.title()
+    for language in (ENGLISH, FRENCH, GERMAN, SPANISH, ITALIAN)
+}
+
+
+class TestComponentGenerator:
+    """Test cases shared by component generators."""
+
+    def test_generator_creation(self, component_generator: AsyncGenerator) -> None:
+        """Test generator creation."""
+        assert isinstance(component_generator, AsyncGenerator)
+
+    @pytest.mark.asyncio
+    async def test_default_templates(self, generator_spec: GeneratorSpec) -> None:
+        """Test default templates existence and loading."""
+        for name in generator_spec.template_names:
+            assert TEMPLATES.joinpath(name).is_file(), f"Template not found: {name}"
+
+        templates = generator_spec.default_template_paths
+        generator = await generator_spec.factory(
+            ai_model="test",
+            system_prompt_template_path=templates["system_prompt"],
+            context_template_path=templates["context"],
+        )
+        assert generator is not None
+
+    @pytest.mark.asyncio
+    async def test_custom_templates(
+        self, generator_spec: GeneratorSpec, template_paths: dict[str, str]
+    ) -> None:
+        """Test custom templates support."""
+        generator = await generator_spec.factory(
+            ai_model="test",
+            system_prompt_template_path=template_paths["system_prompt"],
+            context_template_path=template_paths["context"],
+        )
+        assert generator is not None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "component_context, match",
+        COMPONENT_VALIDATION_CASES,
+        indirect=["component_context"],
+    )
+    async def test_validation(
+        self,
+        component_generator: AsyncGenerator,
+        component_context: ComponentGenerationContext,
+        match: re.Pattern[str],
+    ) -> None:
+        """Test generator validation for required parameters."""
+        with pytest.raises(ValueError, match=match):
+            await component_generator(component_context)
+
+    @pytest.mark.asyncio
+    async def test_generation(
+        self,
+        generator_spec: GeneratorSpec,
+        request: pytest.FixtureRequest,
+        base_context: ComponentGenerationContext,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test generation with a stubbed agent."""
+        payload = request.getfixturevalue(generator_spec.payload_fixture)
+        agent = StubAgent(result=payload)
+        monkeypatch.setattr(generator_spec.module, "Agent", agent.factory)
+
+        generator = await generator_spec.factory(ai_model="test")
+        result = await generator(base_context)
+
+        # Compare with literal DTOs so mapping regressions are caught
+        assert result == generator_spec.expected
+        assert len(agent.run_calls) == 1
+
+    @pytest.mark.parametrize(
+        "language, notes, expect_language_section",
+        [
+            (ENGLISH, None, False),
+            (ENGLISH, "Focus on relevant achievements", False),
+            (FRENCH, None, True),
+            (GERMAN, None, True),
+            (SPANISH, None, True),
+            (ITALIAN, None, True),
+        ],
+        ids=["english", "english-notes", "french", "german", "spanish", "italian"],
+    )
+    def test_context_preparation(
+        self,
+        generator_spec: GeneratorSpec,
+        base_context: ComponentGenerationContext,
+        language: Language,
+        notes: str | None,
+        expect_language_section: bool,
+    ) -> None:
+        """Test rendering of the default context template."""
+        # Build a fresh context per case rather than mutating the shared fixture
+        generation_context = ComponentGenerationContext(
+            cv=base_context.cv,
+            job_description=base_context.job_description,
+            core_competences=base_context.core_competences,
+            notes=notes,
+        )
+        with language_context(language):
+            context = prepare_context(
+                generator_spec.default_template_paths["context"],
+                generation_context,
+                core_competences=generation_context.core_competences,
+            )
+
+        assert generation_context.cv in context
+        assert generation_context.job_description in context
+        assert generation_context.core_competences in context
+        assert ("Language Requirements" in context) == expect_language_section
+        if expect_language_section:
+            assert (
+                f"{generator_spec.language_instruction} {LANGUAGE_NAMES[language]}"
+                in context
+            )
+        assert ("User Notes for Consideration" in context) == bool(notes)
+        if notes:
+            assert notes in context
@@ -1,18 +1,42 @@
+import os
+import re
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from cv_adapter.dto.language import ENGLISH, FRENCH
-from cv_adapter.services.generators.protocols import BaseGenerationContext
-from cv_adapter.services.generators.utils import load_system_prompt, prepare_context
+from cv_adapter.services.generators.protocols import (
+    BaseGenerationContext,
+    ComponentGenerationContext,
+)
+from cv_adapter.services.generators.utils import (
+    get_template_environment,
+    load_system_prompt,
+    prepare_context,
+    validate_component_context,
+    validate_generation_context,
+)
+
+from .base_test import (
+    COMPONENT_VALIDATION_CASES,
+    JOB_DESCRIPTION_REQUIRED,
+    VALID_COMPONENT_CONTEXT,
+)
+
+# Template error patterns, compiled once for pytest.raises(match=...)
+SYSTEM_PROMPT_NOT_FOUND = re.compile("System prompt template not found")
+EMPTY_SYSTEM_PROMPT = re.compile("Rendered system prompt is empty")
+EMPTY_CONTEXT = re.compile("Rendered context template is empty")
+MISSING_CONTEXT_TEMPLATE = re.compile("Context template file does not exist")
 
 
 def create_test_template(tmp_path: Path, filename: str, content: str) -> str:
     """Create a temporary template file for testing."""
     template_path = tmp_path / filename
-    template_path.write_text(content)
-    return str(template_path)
+    template_path.write_bytes(content.encode("utf-8"))
+    return os.fspath(template_path)
 
 
 def test_load_system_prompt_success(tmp_path: Path) -> None:
@@ -26,24 +50,62 @@ def test_load_system_prompt_success(tmp_path: Path) -> None:
     assert result == template_content
 
 
-def test_load_system_prompt_file_not_found() -> None:
+def test_template_environment_is_cached(tmp_path: Path) -> None:
+    """Test that one environment is shared per template directory."""
+    assert get_template_environment(str(tmp_path)) is get_template_environment(
+        str(tmp_path)
+    )
+
+
+def test_load_system_prompt_reloads_changed_template(tmp_path: Path) -> None:
+    """Test that cached templates are reloaded when the file changes."""
+    template_path = create_test_template(tmp_path, "system_prompt.txt", "First")
+    assert load_system_prompt(template_path) == "First"
+
+    Path(template_path).write_text("Second prompt")
+    os.utime(template_path, (0, 0))
+    assert load_system_prompt(template_path) == "Second prompt"
+
+
+def test_load_system_prompt_is_cached(tmp_path: Path) -> None:
+    """Test that an unchanged template is not rendered again."""
+    template_path = create_test_template(tmp_path, "system_prompt.txt", "Prompt")
+    first = load_system_prompt(template_path)
+
+    with patch(
+        "cv_adapter.services.generators.utils.get_template_environment"
+    ) as get_environment:
+        assert load_system_prompt(template_path) is first
+    get_environment.assert_not_called()
+
+
+def test_load_system_prompt_file_not_found(tmp_path: Path) -> None:
     """Test handling of non-existent template file."""
-    with pytest.raises(FileNotFoundError):
+    with pytest.raises(FileNotFoundError, match=SYSTEM_PROMPT_NOT_FOUND):
         load_system_prompt("/path/to/nonexistent/template.txt")
 
+    # A path below a regular file fails with NotADirectoryError on stat
+    file_path = create_test_template(tmp_path, "prompt.j2", "Prompt")
+    with pytest.raises(FileNotFoundError, match=SYSTEM_PROMPT_NOT_FOUND):
+        load_system_prompt(os.path.join(file_path, "template.j2"))
+
 
 def test_load_system_prompt_empty_template(tmp_path: Path) -> None:
     """Test handling of an empty template."""
     template_path = create_test_template(tmp_path, "empty_prompt.txt", "")
 
-    with pytest.raises(RuntimeError, match="Rendered system prompt is empty"):
+    with pytest.raises(RuntimeError, match=EMPTY_SYSTEM_PROMPT):
         load_system_prompt(template_path)
 
 
 @patch(
     "cv_adapter.services.generators.utils.get_current_language", return_value=ENGLISH
 )
-def test_prepare_context_success(mock_get_language: MagicMock, tmp_path: Path) -> None:
+def test_prepare_context_success(
+    mock_get_language: MagicMock,
+    tmp_path: Path,
+    generation_context: BaseGenerationContext,
+) -> None:
     """Test successful context preparation."""
     # Create a test template
     template_content = """
@@ -57,34 +119,10 @@ def test_prepare_context_success(mock_get_language: MagicMock, tmp_path: Path) -
         tmp_path, "context_template.txt", template_content
     )
 
-    # Prepare test data
-    cv_markdown = """# John Doe
-
-## Professional Summary
-Experienced software engineer with a strong background in Python development.
-
-## Work Experience
-### Software Engineer at Tech Company
-- Developed scalable web applications
-- Implemented efficient backend solutions
-
-## Education
-### Computer Science Degree
-University of Technology, 2016-2020
-
-## Skills
-- Python
-- Backend Development
-- Cloud Computing"""
-
-    context = BaseGenerationContext(
-        cv=cv_markdown,
-        job_description="Senior Software Engineer position at Innovative Tech",
-        notes="Test context for CV generation",
-    )
-
     # Prepare context with extra info
-    result = prepare_context(template_path, context, extra_info="Additional details")
+    result = prepare_context(
+        template_path, generation_context, extra_info="Additional details"
+    )
 
     # Verify the rendered context
     assert "Language: en" in result
@@ -94,40 +132,6 @@ University of Technology, 2016-2020
     assert "Extra: Additional details" in result
 
 
-@patch(
-    "cv_adapter.services.generators.utils.get_current_language", return_value=ENGLISH
-)
-def test_prepare_context_file_not_found(mock_get_language: MagicMock) -> None:
-    """Test handling of non-existent context template."""
-    cv_markdown = """# John Doe
-
-## Professional Summary
-Experienced software engineer with a strong background in Python development.
-
-## Work Experience
-### Software Engineer at Tech Company
-- Developed scalable web applications
-- Implemented efficient backend solutions
-
-## Education
-### Computer Science Degree
-University of Technology, 2016-2020
-
-## Skills
-- Python
-- Backend Development
-- Cloud Computing"""
-
-    context = BaseGenerationContext(
-        cv=cv_markdown,
-        job_description="Senior Software Engineer position",
-        notes="Test context for file not found scenario",
-    )
-
-    with pytest.raises(ValueError, match="Context template file does not exist"):
-        prepare_context("/path/to/nonexistent/template.txt", context)
-
-
 @patch("cv_adapter.services.generators.utils.get_current_language", return_value=FRENCH)
 def test_prepare_context_non_english_language(
     mock_get_language: MagicMock, tmp_path: Path
@@ -175,39 +179,55 @@ def test_prepare_context_non_english_language(
     assert "Notes: Test context for French language" in result
 
 
+@pytest.mark.parametrize(
+    "template_content, error, match",
+    [
+        pytest.param(None, ValueError, MISSING_CONTEXT_TEMPLATE, id="missing"),
+        pytest.param("", RuntimeError, EMPTY_CONTEXT, id="empty"),
+    ],
+)
 @patch(
     "cv_adapter.services.generators.utils.get_current_language", return_value=ENGLISH
 )
-def test_prepare_context_empty_template(
-    mock_get_language: MagicMock, tmp_path: Path
+def test_prepare_context_errors(
+    mock_get_language: MagicMock,
+    tmp_path: Path,
+    generation_context: BaseGenerationContext,
+    template_content: str | None,
+    error: type[Exception],
+    match: re.Pattern[str],
 ) -> None:
-    """Test handling of an empty context template."""
-    template_path = create_test_template(tmp_path, "empty_context.txt", "")
+    """Test handling of missing and empty context templates."""
+    if template_content is None:
+        template_path = os.path.join(os.fspath(tmp_path), "missing_context.txt")
+    else:
+        template_path = create_test_template(tmp_path, "context.txt", template_content)
 
-    cv_markdown = """# John Doe
+    with pytest.raises(error, match=match):
+        prepare_context(template_path, generation_context)
 
-## Professional Summary
-Experienced software engineer with a strong background in Python development.
 
-## Work Experience
-### Software Engineer at Tech Company
-- Developed scalable web applications
-- Implemented efficient backend solutions
+@pytest.mark.parametrize("overrides, match", COMPONENT_VALIDATION_CASES)
+def test_validate_component_context_errors(
+    overrides: dict[str, Any], match: re.Pattern[str]
+) -> None:
+    """Test that empty required fields are rejected."""
+    context = ComponentGenerationContext(**{**VALID_COMPONENT_CONTEXT, **overrides})
+    with pytest.raises(ValueError, match=match):
+        validate_component_context(context)
 
-## Education
-### Computer Science Degree
-University of Technology, 2016-2020
 
-## Skills
-- Python
-- Backend Development
-- Cloud Computing"""
+def test_validate_component_context_success() -> None:
+    """Test that a complete component context passes validation."""
+    validate_component_context(ComponentGenerationContext(**VALID_COMPONENT_CONTEXT))
 
-    context = BaseGenerationContext(
-        cv=cv_markdown,
-        job_description="Senior Software Engineer position",
-        notes="Test context for empty template scenario",
-    )
 
-    with pytest.raises(RuntimeError, match="Rendered context template is empty"):
-        prepare_context(template_path, context)
+def test_validate_generation_context_ignores_core_competences() -> None:
+    """Test that base validation only requires CV and job description."""
+    validate_generation_context(
+        BaseGenerationContext(cv="Test CV", job_description="Test job")
+    )
+    with pytest.raises(ValueError, match=JOB_DESCRIPTION_REQUIRED):
+        validate_generation_context(
+            BaseGenerationContext(cv="Test CV", job_description="")
+        )